@@ -2,132 +2,480 @@
 And here's how you can use it in your Jupyter notebook:
 
 ```python
-from hydrate import main
+from hydrate import DocumentProcessor, MinioClient, WeaviateClient
 
 # Define the URLs and bucket name
 urls = ["https://example.com", "https://another-example.com"]
 bucket_name = "cda-datasets"
 
-# Call the main function from the hydrate.py script
-main(urls, bucket_name)
+# Jupyter already runs an event loop, so await the async entry point directly
+processor = DocumentProcessor(MinioClient(), WeaviateClient())
+await processor.fetch_and_process_urls_async(urls, bucket_name, "process_log.txt")
+processor.close()
 ```
 
-In the notebook, you import the main function from the hydrate.py script. Then, you define the urls and bucket_name variables with the desired values. Finally, you call the main function, passing the urls and bucket_name as arguments.
+In the notebook, you import the processor classes from the hydrate.py script. Then, you define the urls and bucket_name variables with the desired values. Finally, you await fetch_and_process_urls_async, passing the urls, the bucket_name and a log file path. Outside a running event loop (plain scripts), call main(urls_file, bucket_name, log_file_path) or processor.fetch_and_process_urls(...) instead.
 This approach allows you to use the hydrate.py script as a modular component within your notebook, providing the necessary input directly from the notebook environment.
 Make sure that the hydrate.py script and the notebook are in the same directory, so that the notebook can import the script correctly.
 """
 from dotenv import load_dotenv
+import asyncio
+import contextlib
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from minio import Minio
+from minio.error import S3Error
 import weaviate
 import os
-import tempfile
+import sys
+import functools
+import gzip
+import hashlib
+import importlib
 import re
-from unstructured.partition.auto import partition
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from selectolax.lexbor import LexborHTMLParser
 import io
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from pydantic import BaseModel, ValidationError, field_validator
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 load_dotenv()  # This loads the environment variables from .env file
 
-class ClientConfig(BaseModel):
+log = logging.getLogger('hydrate')
+
+_SCHEME_RE = re.compile(r'^https?://')
+_NONWORD_RE = re.compile(r'[^\w\-_\.]')
+_WS_RE = re.compile(r'\s+')
+_HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+# Content-Type -> (module, function) of the specialised unstructured partitioner; anything else uses auto
+_PARTITIONERS = {
+    "application/pdf": ("unstructured.partition.pdf", "partition_pdf"),
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+        ("unstructured.partition.docx", "partition_docx"),
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation":
+        ("unstructured.partition.pptx", "partition_pptx"),
+    "text/markdown": ("unstructured.partition.md", "partition_md"),
+}
+
+@dataclass(frozen=True)
+class ClientConfig:
+    # Defaults are read from the environment once, when the module is imported
     minio_endpoint: str = os.getenv('MINIO_ENDPOINT', 'play.min.io:443')
     minio_access_key: str = os.getenv('MINIO_ACCESS_KEY', 'minioadmin')
     minio_secret_key: str = os.getenv('MINIO_SECRET_KEY', 'minioadmin')
     weaviate_endpoint: str = os.getenv('WEAVIATE_ENDPOINT', 'http://localhost:8080')
 
-class MinioClient(BaseModel):
-    config: ClientConfig = Field(default_factory=ClientConfig)
+@functools.lru_cache(maxsize=1)
+def get_config() -> ClientConfig:
+    return ClientConfig()
+
+class MinioClient:
+    __slots__ = ('config', '_client')
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        self.config = config or get_config()
+        self._client = None
 
     @property
     def client(self) -> Minio:
-        return Minio(
-            self.config.minio_endpoint,
-            access_key=self.config.minio_access_key,
-            secret_key=self.config.minio_secret_key,
-            secure=True  # Set to False if you are not using https
-        )
-
-class WeaviateClient(BaseModel):
-    config: ClientConfig = Field(default_factory=ClientConfig)
+        if self._client is None:
+            self._client = Minio(
+                self.config.minio_endpoint,
+                access_key=self.config.minio_access_key,
+                secret_key=self.config.minio_secret_key,
+                secure=True  # Set to False if you are not using https
+            )
+        return self._client
+
+class WeaviateClient:
+    __slots__ = ('config', '_client')
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        self.config = config or get_config()
+        self._client = None
 
     @property
     def client(self) -> weaviate.Client:
-        return weaviate.Client(
-            url=self.config.weaviate_endpoint,
-            timeout_config=(5, 15)
-        )
+        if self._client is None:
+            self._client = weaviate.Client(
+                url=self.config.weaviate_endpoint,
+                timeout_config=(5, 15)
+            )
+        return self._client
 
 class Document(BaseModel):
     source: str
     content: str
 
-    @validator('content')
+    @field_validator('content')
+    @classmethod
     def validate_content(cls, v):
-        if not v.strip():
+        # isspace() scans without allocating a stripped copy of multi-MB documents
+        if not v or v.isspace():
             raise ValueError('Content cannot be empty')
         return v
 
+@functools.lru_cache(maxsize=None)
+def _partitioner(content_type):
+    module_name, func_name = _PARTITIONERS.get(content_type, ("unstructured.partition.auto", "partition"))
+    return getattr(importlib.import_module(module_name), func_name)
+
+def _parse_content_type(header):
+    """Split a Content-Type header into (lowercased mime type, charset or None)."""
+    mime, _, params = (header or "").partition(";")
+    charset = None
+    for param in params.split(";"):
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            charset = value.strip().strip('"\'')
+    return mime.strip().lower(), charset
+
+def _decode(content: bytes, charset) -> Optional[str]:
+    try:
+        return content.decode(charset, errors="replace")
+    except LookupError:  # unknown charset label
+        return None
+
+def _extract_text(content: bytes, content_type: str = "text/html", charset: Optional[str] = None) -> str:
+    # Module-level so it can be pickled into the parse process pool
+    if not content_type or content_type in _HTML_CONTENT_TYPES:
+        html = _decode(content, charset) if charset else None
+        # Without an HTTP charset, let lexbor honour a BOM or <meta charset> instead of assuming UTF-8
+        tree = LexborHTMLParser(html) if html is not None else LexborHTMLParser(content, encoding=True)
+        tree.strip_tags(["script", "style", "noscript"])
+        root = tree.body or tree.root
+        text = root.text(separator="\n", strip=True) if root is not None else ""
+    elif content_type == "text/plain":
+        text = (_decode(content, charset) if charset else None) or content.decode("utf-8", errors="replace")
+    elif content_type in _PARTITIONERS:
+        elements = _partitioner(content_type)(file=io.BytesIO(content))
+        text = "\n".join(e.text for e in elements if getattr(e, 'text', None))
+    else:
+        # Unknown types fall back to unstructured's auto-detecting dispatcher
+        elements = _partitioner(content_type)(file=io.BytesIO(content), content_type=content_type)
+        text = "\n".join(e.text for e in elements if getattr(e, 'text', None))
+    return _WS_RE.sub(' ', text).strip()
+
+def canonicalize_url(url):
+    """Normalise a URL so trivially different spellings of the same page compare equal."""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k not in _TRACKING_PARAMS and not k.startswith("utm_")]
+    scheme, netloc = parts.scheme.lower(), parts.netloc.lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[:-len(default_port)]
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+def dedupe_urls(urls):
+    """Drop URLs whose canonical form was already seen, keeping the first spelling of each."""
+    unique = {}
+    for url in urls:
+        try:
+            key = canonicalize_url(url)
+        except ValueError:
+            key = url  # malformed; kept so the caller can report it as failed
+        unique.setdefault(key, url)
+    return list(unique.values())
+
+def make_uploader(minio: Minio, bucket_name, compress_level: int = 6):
+    """Bind the client and bucket once; the returned upload(object_name, text) gzips and stores the text."""
+    put = minio.put_object
+    metadata = {"Content-Encoding": "gzip"}
+
+    def upload(object_name, text: str):
+        data = gzip.compress(text.encode("utf-8"), compresslevel=compress_level)
+        return put(bucket_name, object_name, io.BytesIO(data), length=len(data),
+                   content_type="text/plain; charset=utf-8", metadata=metadata)
+    return upload
+
+@contextlib.contextmanager
+def _log_to_file(log_file_path):
+    """Route the 'hydrate' logger to log_file_path through a queue so file I/O stays off the hot path."""
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    file_handler = logging.FileHandler(log_file_path)
+    file_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    # Only lower the threshold for the duration of the run, and only on our own logger
+    previous_level = log.level
+    if log.getEffectiveLevel() > logging.INFO:
+        log.setLevel(logging.INFO)
+    log.addHandler(queue_handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        log.removeHandler(queue_handler)
+        log.setLevel(previous_level)
+        listener.stop()
+        file_handler.close()
+
+class UrlCache:
+    """On-disk record of URLs already stored in MinIO, keyed by the SHA-256 of the URL."""
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            "bucket TEXT NOT NULL, url_sha256 TEXT NOT NULL, object_name TEXT NOT NULL, "
+            "etag TEXT, mtime REAL NOT NULL, PRIMARY KEY (bucket, url_sha256))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+
+    def get(self, bucket_name, url) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT object_name FROM objects WHERE bucket = ? AND url_sha256 = ?",
+                (bucket_name, self._key(url)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, bucket_name, url, object_name, etag=None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?)",
+                (bucket_name, self._key(url), object_name, etag, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 class DocumentProcessor:
-    def __init__(self, minio_client: MinioClient, weaviate_client: WeaviateClient):
+    def __init__(self, minio_client: MinioClient, weaviate_client: WeaviateClient, max_concurrency: int = 32,
+                 batch_size: int = 100, num_workers: int = 4, cache_path: Optional[str] = None,
+                 compress_level: int = 6):
         self.minio_client = minio_client
         self.weaviate_client = weaviate_client
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        # 6 balances size against CPU; drop to 1 if uploads become CPU-bound
+        self.compress_level = compress_level
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+        # Text extraction is CPU-bound and runs in worker processes; the blocking MinIO SDK uses threads
+        # Workers start lazily, after the thread pools and log listener are running, so fork() could deadlock
+        self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                               mp_context=multiprocessing.get_context("spawn"))
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        # (bucket_name, object_name) pairs known to exist, so repeat URLs skip the MinIO round-trip
+        self._seen = set()
+        self._cache = UrlCache(cache_path) if cache_path else None
 
     def sanitize_url_to_object_name(self, url):
-        clean_url = re.sub(r'^https?://', '', url)
-        clean_url = re.sub(r'[^\w\-_\.]', '_', clean_url)
-        return clean_url[:250] + '.txt'
+        # Name objects after the canonical URL so other spellings of a page map to the same object across runs
+        clean_url = _NONWORD_RE.sub('_', _SCHEME_RE.sub('', canonicalize_url(url)))
+        return clean_url[:250] + '.txt.gz'
 
     def prepare_text_for_tokenization(self, text):
-        clean_text = re.sub(r'\s+', ' ', text).strip()
-        return clean_text
-
-    def store_in_minio(self, url, bucket_name) -> Optional[str]:
-        object_name = self.sanitize_url_to_object_name(url)
-        
-        exists = self.minio_client.client.bucket_exists(bucket_name) and \
-            any(obj.object_name == object_name for obj in self.minio_client.client.list_objects(bucket_name, prefix=object_name, recursive=True))
-        
-        if exists:
-            print(f"'{object_name}' already exists in MinIO bucket '{bucket_name}'. Skipping.")
-            return None
+        return _WS_RE.sub(' ', text).strip()
+
+    def _remember(self, bucket_name, object_name, url=None, etag=None):
+        self._seen.add((bucket_name, object_name))
+        if url and self._cache:
+            self._cache.put(bucket_name, url, object_name, etag)
+
+    def object_exists(self, bucket_name, object_name, url=None) -> bool:
+        if (bucket_name, object_name) in self._seen:
+            return True
+        if url and self._cache and self._cache.get(bucket_name, url) == object_name:
+            self._seen.add((bucket_name, object_name))
+            return True
 
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            html_content = io.BytesIO(response.content)
-            elements = partition(file=html_content, content_type="text/html")
-            combined_text = "\n".join([e.text for e in elements if hasattr(e, 'text')])
-            combined_text = self.prepare_text_for_tokenization(combined_text)
+            stat = self.minio_client.client.stat_object(bucket_name, object_name)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                return False
+            raise
+        self._remember(bucket_name, object_name, url, stat.etag)
+        return True
+
+    def upload_text(self, bucket_name, object_name, text, url=None, upload=None):
+        if upload is None:
+            upload = make_uploader(self.minio_client.client, bucket_name, self.compress_level)
+        result = upload(object_name, text)
+        self._remember(bucket_name, object_name, url, result.etag)
+        print(f"Stored '{object_name}' in MinIO bucket '{bucket_name}'.")
+
+    def store_content(self, url, content: bytes, bucket_name, content_type="text/html",
+                      charset=None) -> Optional[Tuple[str, str]]:
+        try:
+            object_name = self.sanitize_url_to_object_name(url)
+            combined_text = _extract_text(content, content_type, charset)
+            if not combined_text:
+                print(f"No text extracted from {url}. Skipping.")
+                return None
+            self.upload_text(bucket_name, object_name, combined_text, url)
+            return object_name, combined_text
 
-            with tempfile.NamedTemporaryFile(delete=False, mode="w", encoding="utf-8", suffix=".txt") as tmp_file:
-                tmp_file.write(combined_text)
-                tmp_file_path = tmp_file.name
+        except Exception as e:
+            print(f"Error processing {url}: {e}")
 
-            self.minio_client.client.fput_object(bucket_name, object_name, tmp_file_path)
-            print(f"Stored '{object_name}' in MinIO bucket '{bucket_name}'.")
-            os.remove(tmp_file_path)
-            return object_name
+        return None
+
+    async def store_content_async(self, url, content: bytes, bucket_name,
+                                  content_type="text/html", upload=None, charset=None) -> Optional[Tuple[str, str]]:
+        loop = asyncio.get_running_loop()
+
+        try:
+            object_name = self.sanitize_url_to_object_name(url)
+            combined_text = await loop.run_in_executor(self._parse_pool, _extract_text, content, content_type, charset)
+            # Empty pages (JS-only, image-only PDFs) would fail Document validation, so never store them
+            if not combined_text:
+                print(f"No text extracted from {url}. Skipping.")
+                return None
+            await loop.run_in_executor(self._executor, self.upload_text, bucket_name, object_name, combined_text,
+                                       url, upload)
+            return object_name, combined_text
 
-        except requests.RequestException as e:
-            print(f"Failed to fetch URL {url}: {e}")
         except Exception as e:
             print(f"Error processing {url}: {e}")
-        
+
         return None
 
+    def store_in_minio(self, url, bucket_name) -> Optional[Tuple[str, str]]:
+        try:
+            object_name = self.sanitize_url_to_object_name(url)
+        except ValueError as e:
+            print(f"Invalid URL {url}: {e}")
+            return None
+
+        if self.object_exists(bucket_name, object_name, url):
+            print(f"'{object_name}' already exists in MinIO bucket '{bucket_name}'. Skipping.")
+            return None
+
+        try:
+            response = self.http.get(url)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Failed to fetch URL {url}: {e}")
+            return None
+
+        # Not response.encoding: requests reports ISO-8859-1 for any text/* without a charset
+        content_type, charset = _parse_content_type(response.headers.get("Content-Type"))
+        return self.store_content(url, response.content, bucket_name, content_type, charset)
+
+    async def fetch(self, session: aiohttp.ClientSession, url) -> Tuple[bytes, str, Optional[str]]:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            # response.content_type reports application/octet-stream when the header is missing
+            content_type, charset = _parse_content_type(response.headers.get("Content-Type"))
+            return await response.read(), content_type, charset
+
+    async def process_url(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url, bucket_name,
+                          upload=None) -> Optional[Tuple[str, str]]:
+        """Check, fetch, parse and upload one URL; at most max_concurrency pages are held at once."""
+        loop = asyncio.get_running_loop()
+        try:
+            object_name = self.sanitize_url_to_object_name(url)
+        except ValueError as e:
+            print(f"Invalid URL {url}: {e}")
+            log.info("Failed or skipped: %s", url)
+            return None
+
+        async with semaphore:
+            if await loop.run_in_executor(self._executor, self.object_exists, bucket_name, object_name, url):
+                print(f"'{object_name}' already exists in MinIO bucket '{bucket_name}'. Skipping.")
+                log.info("Failed or skipped: %s", url)
+                return None
+
+            try:
+                content, content_type, charset = await self.fetch(session, url)
+            except Exception as e:
+                print(f"Failed to fetch URL {url}: {e}")
+                log.info("Failed or skipped: %s", url)
+                return None
+
+            result = await self.store_content_async(url, content, bucket_name, content_type, upload, charset)
+
+        if result:
+            log.info("Processed and stored: %s -> %s", url, result[0])
+        else:
+            log.info("Failed or skipped: %s", url)
+        return result
+
+    def insert_batch_to_weaviate(self, items: Iterable[Tuple[str, str]]):
+        """Insert (object_name, text) pairs into Weaviate straight from memory."""
+        data_objects = []
+        for object_name, text in items:
+            try:
+                data_objects.append(Document(source=object_name, content=text))
+            except ValidationError as e:
+                print(f"Skipping invalid document '{object_name}': {e}")
+
+        # The batch context manager does not raise on per-object failures; collect them from the callback
+        failed = {}
+
+        def record_errors(results):
+            for result in results or []:
+                errors = result.get("result", {}).get("errors")
+                if errors:
+                    failed[result.get("properties", {}).get("source")] = errors
+
+        weaviate_client = self.weaviate_client.client
+        # Keep batch_size at 100 or below for very large runs; bigger batches hit timeouts
+        weaviate_client.batch.configure(
+            batch_size=self.batch_size,
+            num_workers=self.num_workers,
+            dynamic=True,
+            timeout_retries=3,
+            callback=record_errors,
+        )
+        with weaviate_client.batch as batch:
+            for data_object in data_objects:
+                batch.add_data_object(data_object.model_dump(), "Document")
+
+        inserted = [data_object.source for data_object in data_objects if data_object.source not in failed]
+        print(f"Inserted {len(inserted)} of {len(data_objects)} documents into Weaviate.")
+        for source, errors in failed.items():
+            print(f"Failed to insert '{source}' into Weaviate: {errors}")
+        for source in inserted:
+            print(f"MinIO and Weaviate have ingested '{source}'! :)")
+        return inserted
+
     def process_documents_in_minio(self, bucket_name, processed_object_names):
+        """Re-index objects already stored in MinIO; their text is stored pre-extracted."""
+        items = []
         for object_name in processed_object_names:
             print(f"Processing document: {object_name}")
-            file_path = object_name
-            self.minio_client.client.fget_object(bucket_name, object_name, file_path)
-            elements = partition(filename=file_path)
-            text_content = "\n".join([e.text for e in elements if hasattr(e, 'text')])
-            data_object = Document(source=object_name, content=text_content)
-            self.weaviate_client.client.data_object.create(data_object.dict(), "Document")
-            print(f"Inserted document '{object_name}' into Weaviate.")
-            os.remove(file_path)
-            print(f"MinIO and Weaviate have ingested '{object_name}'! :)")
+            response = self.minio_client.client.get_object(bucket_name, object_name)
+            try:
+                data = response.read()
+            finally:
+                response.close()
+                response.release_conn()
+            # The HTTP layer may already have undone Content-Encoding: gzip, so check the magic bytes
+            if data[:2] == b"\x1f\x8b":
+                data = gzip.decompress(data)
+            items.append((object_name, data.decode("utf-8")))
+        self.insert_batch_to_weaviate(items)
 
     ## v0.1.0 - Latest working from Juno (Modular usage)
     # def fetch_and_process_urls(self, urls, bucket_name):
@@ -168,29 +516,59 @@ class DocumentProcessor:
 #     processor = DocumentProcessor(minio_client, weaviate_client)
 #     processor.fetch_and_process_urls(urls, bucket_name)
 
-## For GitHub Tailscale (tags=ci)
-def fetch_and_process_urls(self, urls, bucket_name, log_file_path):
-    processed_object_names = []  # Track successfully processed URLs
-    with open(log_file_path, 'a') as log_file:
-        if not self.minio_client.client.bucket_exists(bucket_name):
-            self.minio_client.client.make_bucket(bucket_name)
-            log_file.write(f"Bucket '{bucket_name}' created.\n")
-
-        for url in urls:
-            object_name = self.store_in_minio(url, bucket_name)
-            if object_name:
-                processed_object_names.append(object_name)
-                log_file.write(f"Processed and stored: {url} -> {object_name}\n")
-            else:
-                log_file.write(f"Failed or skipped: {url}\n")
-
-        if processed_object_names:
-            self.process_documents_in_minio(bucket_name, processed_object_names, log_file)
-
-def main(urls_file, bucket_name, log_file_path):
-    config = ClientConfig()
+    ## For GitHub Tailscale (tags=ci)
+    async def fetch_and_process_urls_async(self, urls, bucket_name, log_file_path):
+        with _log_to_file(log_file_path):
+            if not self.minio_client.client.bucket_exists(bucket_name):
+                self.minio_client.client.make_bucket(bucket_name)
+                log.info("Bucket '%s' created.", bucket_name)
+
+            urls = dedupe_urls(urls)
+            # One coroutine per URL, so parsing and uploading overlap with other pages still downloading
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            upload = make_uploader(self.minio_client.client, bucket_name, self.compress_level)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                results = await asyncio.gather(*(
+                    self.process_url(session, semaphore, url, bucket_name, upload) for url in urls
+                ))
+            processed = [result for result in results if result]  # (object_name, text) pairs
+
+        if processed:
+            self.insert_batch_to_weaviate(processed)
+
+    def fetch_and_process_urls(self, urls, bucket_name, log_file_path):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "fetch_and_process_urls() cannot run inside an event loop (e.g. Jupyter); "
+                "use 'await processor.fetch_and_process_urls_async(...)' instead"
+            )
+        asyncio.run(self.fetch_and_process_urls_async(urls, bucket_name, log_file_path))
+
+    def close(self):
+        self._parse_pool.shutdown()
+        self._executor.shutdown()
+        self.http.close()
+        if self._cache:
+            self._cache.close()
+
+def main(urls_file, bucket_name, log_file_path, cache_path=None):
+    with open(urls_file) as f:
+        urls = [line.strip() for line in f if line.strip()]
+
+    config = get_config()
     minio_client = MinioClient(config=config)
     weaviate_client = WeaviateClient(config=config)
 
-    processor = DocumentProcessor(minio_client, weaviate_client)
-    processor.fetch_and_process_urls(urls, bucket_name, log_file_path)
+    processor = DocumentProcessor(minio_client, weaviate_client, cache_path=cache_path)
+    try:
+        processor.fetch_and_process_urls(urls, bucket_name, log_file_path)
+    finally:
+        processor.close()
+
+if __name__ == "__main__":
+    main(*sys.argv[1:5])
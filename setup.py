@@ -14,15 +14,14 @@ setup(
     author_email='cdaprod@cdaprod.dev',
     url='https://github.com/Cdaprod/hydrate',
     install_requires=[
-        'requests',
-        'minio',
-        'weaviate-client',
-        'pydantic',
-        'unstructured',
-        'io',
-        'tempfile',
-        're',
-        'dotenv'
+        'requests>=2.31,<3',
+        'aiohttp>=3.8,<4',
+        'minio>=7.1,<8',
+        'weaviate-client>=3.26,<4',
+        'pydantic>=2,<3',
+        'unstructured>=0.10,<1',
+        'selectolax>=1.0,<2',
+        'python-dotenv>=1.0,<2',
     ],
     classifiers=[
         'Development Status :: 3 - Alpha',